@@ -62,7 +62,7 @@ class crifanEvernoteToWordpress(object):
             generatedImgeUrl = self.wordpress.generateUploadedImageUrl(imgeFilename)
             # https://www.crifan.org/files/pic/uploads/2021/03/f60ea32cf4664b41922431f4ea015621.jpg
             # 'url':'https://www.crifan.org/files/pic/uploads/2021/03/f60ea32cf4664b41922431f4ea015621-1.jpg'
-            isValid = utils.isValidImageUrl(generatedImgeUrl, proxies=self.wordpress.requestsProxies)
+            isValid = self.wordpress.isValidImageUrl(generatedImgeUrl)
             if isValid:
                 logging.info("Found existed image %s", generatedImgeUrl)
                 isUploadImgOk = True
@@ -262,12 +262,21 @@ class crifanEvernoteToWordpress(object):
         #         break
 
         existedCategoryList = []
-        for eachTagName in tagNameList:
-            isSearhOk, existedCategory = self.wordpress.searchTaxonomy(eachTagName, "category")
-            # True, {'_links': {'about': [...], 'collection': [...], 'curies': [...], 'self': [...], 'up': [...], 'wp:post_type': [...]}, 'count': 35, 'description': '', 'id': 3178, 'link': 'https://www.crifan.c...s_windows/', 'meta': [], 'name': 'Windows', 'parent': 4624, 'slug': 'os_windows', 'taxonomy': 'category'}
-            logging.debug("isSearhOk=%s, existedCategory=%s", isSearhOk, existedCategory)
-            if isSearhOk and existedCategory:
-                existedCategoryList.append(existedCategory)
+        # get whole category list once (cached for later notes), then find all tag names from it locally
+        isGetAllOk, allCategoryList = self.wordpress.getTaxonomyList("category")
+        if isGetAllOk:
+            foundCategoryList = crifanWordpress.findSameNameTaxonomyList(tagNameList, allCategoryList)
+            # [{'_links': {'about': [...], 'collection': [...], 'curies': [...], 'self': [...], 'up': [...], 'wp:post_type': [...]}, 'count': 35, 'description': '', 'id': 3178, 'link': 'https://www.crifan.c...s_windows/', 'meta': [], 'name': 'Windows', 'parent': 4624, 'slug': 'os_windows', 'taxonomy': 'category'}, None]
+            logging.debug("tagNameList=%s, foundCategoryList=%s", tagNameList, foundCategoryList)
+            existedCategoryList = [eachCategory for eachCategory in foundCategoryList if eachCategory]
+        else:
+            logging.warning("Fail to get all category, search each tag name: %s", allCategoryList)
+            for eachTagName in tagNameList:
+                isSearhOk, existedCategory = self.wordpress.searchTaxonomy(eachTagName, "category")
+                # True, {'_links': {'about': [...], 'collection': [...], 'curies': [...], 'self': [...], 'up': [...], 'wp:post_type': [...]}, 'count': 35, 'description': '', 'id': 3178, 'link': 'https://www.crifan.c...s_windows/', 'meta': [], 'name': 'Windows', 'parent': 4624, 'slug': 'os_windows', 'taxonomy': 'category'}
+                logging.debug("isSearhOk=%s, existedCategory=%s", isSearhOk, existedCategory)
+                if isSearhOk and existedCategory:
+                    existedCategoryList.append(existedCategory)
 
         if existedCategoryList:
             existedCategoryList.sort(key = itemgetter("count"), reverse=True)